@@ -44,6 +44,8 @@ def get_datamodule(config: Union[DictConfig, ListConfig]) -> LightningDataModule
             transform_config_train=config.dataset.transform_config.train,
             transform_config_val=config.dataset.transform_config.val,
             create_validation_set=config.dataset.create_validation_set,
+            cache_in_memory=config.dataset.get("cache_in_memory", False),
+            cache_raw=config.dataset.get("cache_raw", False),
         )
     elif config.dataset.format.lower() == "btech":
         datamodule = BTech(
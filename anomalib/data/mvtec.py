@@ -28,19 +28,26 @@ Reference:
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import os
+import shutil
+import struct
+import subprocess
 import tarfile
 import warnings
+from functools import reduce
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
-from urllib.request import urlretrieve
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 import albumentations as A
 import cv2
 import numpy as np
 import pandas as pd
+import torch
 from pandas.core.frame import DataFrame
 from pytorch_lightning.core.datamodule import LightningDataModule
 from pytorch_lightning.utilities.cli import DATAMODULE_REGISTRY
+from pytorch_lightning.utilities.seed import pl_worker_init_function
 from pytorch_lightning.utilities.types import EVAL_DATALOADERS, TRAIN_DATALOADERS
 from torch import Tensor
 from torch.utils.data import DataLoader
@@ -48,7 +55,7 @@ from torch.utils.data.dataset import Dataset
 from torchvision.datasets.folder import VisionDataset
 
 from anomalib.data.inference import InferenceDataset
-from anomalib.data.utils import DownloadProgressBar, hash_check, read_image
+from anomalib.data.utils import download_file, hash_check, read_image
 from anomalib.data.utils.split import (
     create_validation_set_from_test_set,
     split_normal_images_in_train_set,
@@ -57,6 +64,223 @@ from anomalib.pre_processing import PreProcessor
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_CACHE_DISABLE_ENV = "ANOMALIB_DISABLE_SAMPLE_CACHE"
+# Part of the sample cache filename. Bump it whenever the columns or the order of the cached samples change, so
+# that caches written by older versions are not read back.
+SAMPLE_CACHE_VERSION = 1
+
+# Arrow-backed strings are stored in contiguous buffers rather than as one Python object per row. They require
+# pyarrow and pandas>=1.3, and the path columns are kept as objects otherwise.
+try:
+    ARROW_STRING_DTYPE: Optional[pd.StringDtype] = pd.StringDtype("pyarrow")
+except (ImportError, TypeError):
+    ARROW_STRING_DTYPE = None
+
+
+def _iter_png_files(root: Path) -> Iterator[str]:
+    """Recursively yield the paths of the png files under ``root``.
+
+    The directory tree is traversed iteratively with ``os.scandir``, which reuses the cached type
+    information of each directory entry rather than creating a ``Path`` object and issuing a ``stat``
+    call per file as ``Path.glob`` does. The files are yielded in the same order as ``Path.glob("**/*.png")``:
+    the files of a directory come first, followed by its subdirectories in pre-order, so that seeded
+    random splits of the samples are unchanged.
+
+    Args:
+        root (Path): Path to the directory to traverse.
+
+    Yields:
+        str: Path of each png file found under ``root``.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        subdirectories = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif entry.name.endswith(".png"):
+                    yield entry.path
+        # Push the subdirectories in reverse so that they are popped in scandir order.
+        stack.extend(reversed(subdirectories))
+
+
+def _png_image_shape(path: str) -> Optional[Tuple[int, int, int]]:
+    """Get the shape of a png image as decoded by ``read_image`` from its header, without decoding it.
+
+    Args:
+        path (str): Path to the png image.
+
+    Returns:
+        Optional[Tuple[int, int, int]]: Height, width and number of channels of the decoded RGB image, or ``None``
+            if the file does not start with a png header.
+    """
+    with open(path, "rb") as png_file:
+        header = png_file.read(24)
+    if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", header[16:24])
+    return height, width, 3
+
+
+def _extract_tar_xz(archive: Path, root: Path) -> None:
+    """Extract a ``.tar.xz`` archive into ``root``.
+
+    Python's ``lzma`` decoder is single-threaded, so the archive is extracted with the system ``tar`` using
+    multi-threaded ``xz -T0`` decompression when both tools are available. Falls back to ``tarfile`` otherwise,
+    or if the external extraction fails.
+
+    Args:
+        archive (Path): Path to the archive.
+        root (Path): Directory to extract the archive into.
+    """
+    tar_executable, xz_executable = shutil.which("tar"), shutil.which("xz")
+    if tar_executable is not None and xz_executable is not None:
+        command = [tar_executable, "-I", f"{xz_executable} -T0", "-xf", str(archive), "-C", str(root)]
+        try:
+            subprocess.run(command, check=True, capture_output=True)
+            return
+        except (OSError, subprocess.CalledProcessError) as error:
+            logger.warning("Multi-threaded extraction failed (%s). Falling back to tarfile.", error)
+
+    with tarfile.open(archive) as tar_file:
+        tar_file.extractall(root)
+
+
+def _contains_png(directory: Path) -> bool:
+    """Check whether there is at least one png file under ``directory``.
+
+    Args:
+        directory (Path): Path to the directory to check.
+
+    Returns:
+        bool: ``True`` if the directory exists and contains a png file.
+    """
+    return directory.is_dir() and next(_iter_png_files(directory), None) is not None
+
+
+def _concat(*parts: Union[np.ndarray, str]) -> np.ndarray:
+    """Element-wise concatenate string arrays and scalars in a single vectorized pass.
+
+    Args:
+        *parts (Union[np.ndarray, str]): String arrays of equal length or strings broadcast to every element.
+
+    Returns:
+        np.ndarray: Array containing the concatenated strings.
+    """
+    return reduce(np.char.add, map(np.asarray, parts))
+
+
+def _worker_init_fn(worker_id: int) -> None:
+    """Limit the intra-op threads of a dataloader worker.
+
+    OpenCV and PyTorch each spawn a thread per core by default, so ``num_workers`` processes would run
+    ``num_workers`` times as many threads as there are cores. Each worker is limited to a single thread instead.
+    Lightning's worker seeding is preserved when it is enabled with ``seed_everything(workers=True)``.
+
+    Args:
+        worker_id (int): Index of the dataloader worker.
+    """
+    cv2.setNumThreads(0)
+    torch.set_num_threads(1)
+    if int(os.environ.get("PL_SEED_WORKERS", 0)):
+        pl_worker_init_function(worker_id)
+
+
+def _raw_image_cache_paths(path: Path) -> Tuple[Path, Path]:
+    """Get the paths of the raw image cache of a category and of its index.
+
+    Args:
+        path (Path): Path to the category of the dataset.
+
+    Returns:
+        Tuple[Path, Path]: Paths to the file holding the raw images and to the index of the file.
+    """
+    return path / ".raw_images.bin", path / ".raw_images_index.npz"
+
+
+def _write_raw_image_cache(path: Path) -> None:
+    """Decode the images of a category once and write them to a single raw uint8 file.
+
+    The images are written back to back, and their offsets and shapes are stored in a sidecar index keyed by the
+    image path relative to ``path``. Dataloader workers memory-map the file and slice the images out of it instead
+    of decoding a png for every item, sharing the pages through the OS page cache.
+
+    Args:
+        path (Path): Path to the category of the dataset.
+    """
+    cache_path, index_path = _raw_image_cache_paths(path)
+    samples = make_mvtec_dataset(path=path)
+    root_length = len(str(path)) + 1
+
+    keys, offsets, shapes = [], [], []
+    offset = 0
+    temporary_cache_path, temporary_index_path = cache_path.with_suffix(".tmp"), index_path.with_suffix(".tmp")
+    try:
+        with open(temporary_cache_path, "wb") as cache_file:
+            for image_path in samples.image_path:
+                image = np.ascontiguousarray(read_image(image_path))
+                cache_file.write(image.tobytes())
+                keys.append(image_path[root_length:])
+                offsets.append(offset)
+                shapes.append(image.shape)
+                offset += image.nbytes
+
+        with open(temporary_index_path, "wb") as index_file:
+            np.savez(index_file, keys=np.array(keys), offsets=np.array(offsets), shapes=np.array(shapes))
+        # Only move the files in place once they are complete, so that an interrupted run does not leave a partial
+        # cache. The index is moved last, since the cache is only used when both files exist.
+        temporary_cache_path.replace(cache_path)
+        temporary_index_path.replace(index_path)
+    except OSError as error:
+        logger.warning("Could not write the raw image cache to %s: %s", cache_path, error)
+        for temporary_path in (temporary_cache_path, temporary_index_path):
+            if temporary_path.exists():
+                temporary_path.unlink()
+
+
+def _dataset_fingerprint(path: Path) -> str:
+    """Get a fingerprint of the image directories of a category, which changes whenever images are added or removed.
+
+    The fingerprint consists of the modification time and the number of entries of every label directory of the
+    train and test splits, which only takes a single ``os.scandir`` per directory.
+
+    Args:
+        path (Path): Path to the category of the dataset.
+
+    Returns:
+        str: Fingerprint of the image directories.
+    """
+    entries = []
+    for split_dir in ("train", "test"):
+        if not (path / split_dir).is_dir():
+            continue
+        with os.scandir(path / split_dir) as label_dirs:
+            for label_dir in label_dirs:
+                if label_dir.is_dir(follow_symlinks=False):
+                    with os.scandir(label_dir.path) as images:
+                        num_entries = sum(1 for _ in images)
+                    entries.append(f"{split_dir}/{label_dir.name}:{label_dir.stat().st_mtime_ns}:{num_entries}")
+    return ";".join(sorted(entries))
+
+
+def _use_arrow_strings(samples: DataFrame) -> DataFrame:
+    """Store the image and mask path columns of the samples as Arrow-backed strings, if available.
+
+    Besides reducing the allocations, this avoids the copy-on-access of the path objects in forked dataloader
+    workers, which otherwise touch the reference count of every string they read.
+
+    Args:
+        samples (DataFrame): Dataframe containing the ``image_path`` and ``mask_path`` columns.
+
+    Returns:
+        DataFrame: Dataframe with the converted path columns.
+    """
+    if ARROW_STRING_DTYPE is None:
+        return samples
+    return samples.astype({"image_path": ARROW_STRING_DTYPE, "mask_path": ARROW_STRING_DTYPE})
+
 
 def make_mvtec_dataset(
     path: Path,
@@ -110,43 +334,72 @@ def make_mvtec_dataset(
     Returns:
         DataFrame: an output dataframe containing samples for the requested split (ie., train or test)
     """
-    samples_list = [(str(path),) + filename.parts[-3:] for filename in path.glob("**/*.png")]
-    if len(samples_list) == 0:
+    # Masks are resolved from the image filenames below, so the ground_truth directory is not traversed. When a
+    # single split is requested, only its directory is traversed, unless the test set has no normal images, in
+    # which case normal training images are moved to the test set and both directories are needed.
+    has_normal_test_images = _contains_png(path / "test" / "good")
+    split_dirs = ["train", "test"]
+    if split in ["train", "val", "test"] and has_normal_test_images:
+        split_dirs = ["train"] if split == "train" else ["test"]
+
+    root = str(path)
+    split_list, label_list, filename_list = [], [], []
+    for split_dir in split_dirs:
+        if not (path / split_dir).is_dir():
+            continue
+        for file_path in _iter_png_files(path / split_dir):
+            split_name, label, filename = file_path.rsplit(os.sep, 3)[-3:]
+            split_list.append(split_name)
+            label_list.append(label)
+            filename_list.append(filename)
+    if len(filename_list) == 0:
         raise RuntimeError(f"Found 0 images in {path}")
 
-    samples = pd.DataFrame(samples_list, columns=["path", "split", "label", "image_path"])
-    samples = samples[samples.split != "ground_truth"]
+    splits = np.array(split_list)
+    labels = np.array(label_list)
+    filenames = np.array(filename_list)
 
     # Create mask_path column
-    samples["mask_path"] = (
-        samples.path
-        + "/ground_truth/"
-        + samples.label
-        + "/"
-        + samples.image_path.str.rstrip("png").str.rstrip(".")
-        + "_mask.png"
+    stems = np.char.rpartition(filenames, ".png")[:, 0]
+    mask_paths = _concat(root, "/ground_truth/", labels, "/", stems, "_mask.png")
+
+    # Create image_path column containing absolute paths
+    image_paths = _concat(root, "/", splits, "/", labels, "/", filenames)
+
+    # Store the repeated path, split and label strings as categoricals, which keeps a single copy of each
+    # distinct value and turns comparisons against them into integer comparisons. The split categories are
+    # listed explicitly since the split utils move samples to the test and val splits.
+    samples = pd.DataFrame(
+        {
+            "path": pd.Categorical.from_codes(np.zeros(len(filenames), dtype=np.int8), categories=[root]),
+            "split": pd.Categorical(splits, categories=["train", "val", "test"]),
+            "label": pd.Categorical(labels),
+            "image_path": image_paths,
+            "mask_path": mask_paths,
+        },
+        copy=False,
     )
 
-    # Modify image_path column by converting to absolute path
-    samples["image_path"] = samples.path + "/" + samples.split + "/" + samples.label + "/" + samples.image_path
-
     # Split the normal images in training set if test set doesn't
     # contain any normal images. This is needed because AUC score
     # cannot be computed based on 1-class
-    if sum((samples.split == "test") & (samples.label == "good")) == 0:
+    if not has_normal_test_images:
         samples = split_normal_images_in_train_set(samples, split_ratio, seed)
 
+    is_good = samples.label.to_numpy() == "good"
+
     # Good images don't have mask
-    samples.loc[(samples.split == "test") & (samples.label == "good"), "mask_path"] = ""
+    is_good_test = (samples.split.to_numpy() == "test") & is_good
+    samples["mask_path"] = np.where(is_good_test, "", samples.mask_path.to_numpy())
 
     # Create label index for normal (0) and anomalous (1) images.
-    samples.loc[(samples.label == "good"), "label_index"] = 0
-    samples.loc[(samples.label != "good"), "label_index"] = 1
-    samples.label_index = samples.label_index.astype(int)
+    samples["label_index"] = (~is_good).astype(np.int8)
 
     if create_validation_set:
         samples = create_validation_set_from_test_set(samples, seed=seed)
 
+    samples = _use_arrow_strings(samples)
+
     # Get the data frame for the split.
     if split is not None and split in ["train", "val", "test"]:
         samples = samples[samples.split == split]
@@ -155,6 +408,78 @@ def make_mvtec_dataset(
     return samples
 
 
+def _load_mvtec_samples(
+    path: Path,
+    split: Optional[str] = None,
+    seed: Optional[int] = None,
+    create_validation_set: bool = False,
+) -> DataFrame:
+    """Load MVTec AD samples from the on-disk cache, or parse the dataset and cache the result.
+
+    The parsed dataframe is stored as a feather file next to the dataset and read back on subsequent runs instead
+    of walking the file system again. The cache is keyed by the cache version, the seed and the validation set
+    flag, and is only used when the seed is set since the split is random otherwise. It stores a fingerprint of the
+    image directories, and is rebuilt when images have been added or removed since it was written, or when it is
+    unreadable. Caching requires ``pyarrow`` and can be disabled by
+    setting the ``ANOMALIB_DISABLE_SAMPLE_CACHE`` environment variable.
+
+    Args:
+        path (Path): Path to dataset
+        split (str, optional): Dataset split (ie., either train, val or test). Defaults to None.
+        seed (int, optional): Random seed to ensure reproducibility when splitting. Defaults to None.
+        create_validation_set (bool, optional): Boolean to create a validation set from the test set.
+
+    Returns:
+        DataFrame: an output dataframe containing samples for the requested split (ie., train, val or test)
+    """
+    use_cache = seed is not None and find_spec("pyarrow") is not None and not os.environ.get(SAMPLE_CACHE_DISABLE_ENV)
+    if not use_cache:
+        return make_mvtec_dataset(path=path, split=split, seed=seed, create_validation_set=create_validation_set)
+
+    # pyarrow is only required by the cache, which is not used unless pyarrow is installed.
+    # pylint: disable=import-outside-toplevel
+    import pyarrow as pa
+    from pyarrow import ArrowException, feather
+
+    cache_path = path / f".samples_c{SAMPLE_CACHE_VERSION}_s{seed}_v{int(create_validation_set)}.feather"
+    # The fingerprint is taken before the dataset is parsed, so that images added while it is parsed invalidate the
+    # cache on the next run.
+    fingerprint = _dataset_fingerprint(path).encode()
+    samples: Optional[DataFrame] = None
+    if cache_path.exists():
+        try:
+            table = feather.read_table(cache_path)
+            if (table.schema.metadata or {}).get(b"anomalib_fingerprint") == fingerprint:
+                samples = _use_arrow_strings(table.to_pandas())
+        except (ValueError, ArrowException, OSError) as error:
+            logger.warning("Could not read the sample cache from %s, rebuilding it: %s", cache_path, error)
+        # The cache stores the dataset path, so discard it if the dataset has been moved or accessed via another root.
+        if samples is not None and (len(samples) == 0 or samples.path[0] != str(path)):
+            samples = None
+
+    if samples is None:
+        samples = make_mvtec_dataset(path=path, seed=seed, create_validation_set=create_validation_set)
+        samples = samples.reset_index(drop=True)
+        # Write to a file unique to this process and move it in place once complete, so that concurrent writers,
+        # such as the ranks of a distributed run, never read a partially written cache.
+        temporary_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            table = pa.Table.from_pandas(samples, preserve_index=False)
+            table = table.replace_schema_metadata({**table.schema.metadata, b"anomalib_fingerprint": fingerprint})
+            feather.write_feather(table, temporary_path)
+            temporary_path.replace(cache_path)
+        except (ArrowException, OSError) as error:
+            logger.warning("Could not write the sample cache to %s: %s", cache_path, error)
+            if temporary_path.exists():
+                temporary_path.unlink()
+
+    if split is not None and split in ["train", "val", "test"]:
+        samples = samples[samples.split == split]
+        samples = samples.reset_index(drop=True)
+
+    return samples
+
+
 class MVTecDataset(VisionDataset):
     """MVTec AD PyTorch Dataset."""
 
@@ -167,6 +492,7 @@ class MVTecDataset(VisionDataset):
         task: str = "segmentation",
         seed: Optional[int] = None,
         create_validation_set: bool = False,
+        samples: Optional[DataFrame] = None,
     ) -> None:
         """Mvtec AD Dataset class.
 
@@ -178,6 +504,9 @@ class MVTecDataset(VisionDataset):
             task: ``classification`` or ``segmentation``
             seed: seed used for the random subset splitting
             create_validation_set: Create a validation subset in addition to the train and test subsets
+            samples: Samples of all splits parsed by ``make_mvtec_dataset``, from which the samples of ``split`` are
+                selected. This allows datasets of different splits to share a single parse. When ``None``, the
+                samples are parsed from ``root``.
 
         Examples:
             >>> from anomalib.data.mvtec import MVTecDataset
@@ -225,12 +554,101 @@ class MVTecDataset(VisionDataset):
 
         self.pre_process = pre_process
 
-        self.samples = make_mvtec_dataset(
-            path=self.root / category,
-            split=self.split,
-            seed=seed,
-            create_validation_set=create_validation_set,
-        )
+        if samples is None:
+            self.samples = _load_mvtec_samples(
+                path=self.root / category,
+                split=self.split,
+                seed=seed,
+                create_validation_set=create_validation_set,
+            )
+        else:
+            self.samples = samples[samples.split == self.split].reset_index(drop=True)
+
+        self.image_cache: Optional[Tensor] = None
+        self.raw_cache_path: Optional[Path] = None
+        self.raw_offsets: np.ndarray
+        self.raw_shapes: np.ndarray
+        self._raw_images: Optional[np.memmap] = None
+
+    def cache_images(self) -> None:
+        """Decode the images of the dataset once and store them in a shared memory tensor.
+
+        Dataloader workers then index the decoded images instead of reading and decoding them from disk for each
+        item. The images are stacked into a single tensor, so caching is skipped when their sizes differ. The sizes
+        are read from the png headers before the tensor is allocated.
+        """
+        if len(self.samples) == 0:
+            return
+
+        image_paths = self.samples.image_path
+        shapes = {_png_image_shape(image_path) for image_path in image_paths}
+        shape = shapes.pop()
+        if shapes or shape is None:
+            logger.warning("Images of %s differ in size and will not be cached in memory.", self.root)
+            return
+
+        cache = torch.empty((len(image_paths), *shape), dtype=torch.uint8).share_memory_()
+        for index, image_path in enumerate(image_paths):
+            cache[index] = torch.from_numpy(read_image(image_path))
+        self.image_cache = cache
+
+    def use_raw_image_cache(self, cache_path: Path, index_path: Path) -> None:
+        """Read the images of the dataset from a raw image cache written by ``_write_raw_image_cache``.
+
+        The cache is ignored, and the images are decoded from disk, when it is missing or does not contain all
+        the images of the dataset.
+
+        Args:
+            cache_path (Path): Path to the file holding the raw images.
+            index_path (Path): Path to the index of the file.
+        """
+        if not (cache_path.is_file() and index_path.is_file()):
+            logger.warning("The raw image cache %s does not exist and will not be used.", cache_path)
+            return
+
+        index = np.load(index_path)
+        positions = {key: position for position, key in enumerate(index["keys"])}
+        root_length = len(str(self.root / self.category)) + 1
+        rows = [positions.get(image_path[root_length:]) for image_path in self.samples.image_path]
+        if any(row is None for row in rows):
+            logger.warning("The raw image cache %s is out of date and will not be used.", cache_path)
+            return
+
+        self.raw_offsets = index["offsets"][rows]
+        self.raw_shapes = index["shapes"][rows]
+        self.raw_cache_path = cache_path
+        self._raw_images = None
+
+    def _read_image(self, index: int, image_path: str) -> np.ndarray:
+        """Read the image of the item ``index`` from the in-memory or raw image cache, or from disk.
+
+        Args:
+            index (int): Index of the item.
+            image_path (str): Path to the image of the item.
+
+        Returns:
+            np.ndarray: RGB image. Images read from a cache are read-only views of the cache.
+        """
+        if self.image_cache is not None:
+            image = self.image_cache[index].numpy()
+            # The cache is shared by all dataloader workers, so in-place transforms must not modify it.
+            image.flags.writeable = False
+            return image
+
+        if self.raw_cache_path is not None:
+            # The file is mapped lazily so that each dataloader worker maps it on its first item.
+            if self._raw_images is None:
+                self._raw_images = np.memmap(self.raw_cache_path, dtype=np.uint8, mode="r")
+            offset, shape = self.raw_offsets[index], tuple(self.raw_shapes[index])
+            return self._raw_images[offset : offset + int(np.prod(shape))].reshape(shape)
+
+        return read_image(image_path)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state of the dataset to pickle, without the memory map of the raw image cache."""
+        state = self.__dict__.copy()
+        state["_raw_images"] = None
+        return state
 
     def __len__(self) -> int:
         """Get length of the dataset."""
@@ -249,7 +667,7 @@ class MVTecDataset(VisionDataset):
         item: Dict[str, Union[str, Tensor]] = {}
 
         image_path = self.samples.image_path[index]
-        image = read_image(image_path)
+        image = self._read_image(index, image_path)
 
         pre_processed = self.pre_process(image=image)
         item = {"image": pre_processed["image"]}
@@ -297,6 +715,8 @@ class MVTec(LightningDataModule):
         transform_config_val: Optional[Union[str, A.Compose]] = None,
         seed: Optional[int] = None,
         create_validation_set: bool = False,
+        cache_in_memory: bool = False,
+        cache_raw: bool = False,
     ) -> None:
         """Mvtec AD Lightning Data Module.
 
@@ -312,6 +732,11 @@ class MVTec(LightningDataModule):
             transform_config_val: Config for pre-processing during validation.
             seed: seed used for the random subset splitting
             create_validation_set: Create a validation subset in addition to the train and test subsets
+            cache_in_memory: Decode the training images once and keep them in shared memory instead of reading
+                them from disk every epoch. The images are cached at their full decoded resolution, before they are
+                resized by the transforms, so this requires height x width x 3 bytes of memory per training image.
+            cache_raw: Decode all images once to a raw file next to the dataset, which is memory-mapped by the
+                dataloader workers instead of decoding the images for every item.
 
         Examples:
             >>> from anomalib.data import MVTec
@@ -359,6 +784,8 @@ class MVTec(LightningDataModule):
         self.num_workers = num_workers
 
         self.create_validation_set = create_validation_set
+        self.cache_in_memory = cache_in_memory
+        self.cache_raw = cache_raw
         self.task = task
         self.seed = seed
 
@@ -379,22 +806,20 @@ class MVTec(LightningDataModule):
             url = "https://www.mydrive.ch/shares/38536/3830184030e49fe74747669442f0f282/download/420938113-1629952094"
             dataset_name = "mvtec_anomaly_detection.tar.xz"
             zip_filename = self.root / dataset_name
-            with DownloadProgressBar(unit="B", unit_scale=True, miniters=1, desc="MVTec AD") as progress_bar:
-                urlretrieve(
-                    url=f"{url}/{dataset_name}",
-                    filename=zip_filename,
-                    reporthook=progress_bar.update_to,
-                )
+            download_file(url=f"{url}/{dataset_name}", file_path=zip_filename, desc="MVTec AD")
             logger.info("Checking hash")
             hash_check(zip_filename, "eefca59f2cede9c3fc5b6befbfec275e")
 
             logger.info("Extracting the dataset.")
-            with tarfile.open(zip_filename) as tar_file:
-                tar_file.extractall(self.root)
+            _extract_tar_xz(zip_filename, self.root)
 
             logger.info("Cleaning the tar file")
             (zip_filename).unlink()
 
+        if self.cache_raw and not all(cache.exists() for cache in _raw_image_cache_paths(self.dataset_path)):
+            logger.info("Writing the raw image cache.")
+            _write_raw_image_cache(self.dataset_path)
+
     def setup(self, stage: Optional[str] = None) -> None:
         """Setup train, validation and test data.
 
@@ -403,7 +828,17 @@ class MVTec(LightningDataModule):
 
         """
         logger.info("Setting up train, validation, test and prediction datasets.")
-        if stage in (None, "fit"):
+        # Parse the dataset once and share the samples between the splits. The training images are only
+        # needed when fitting, so only the test set is parsed otherwise, unless a validation set is requested.
+        needs_train_split = stage in (None, "fit")
+        samples = _load_mvtec_samples(
+            path=self.dataset_path,
+            split=None if needs_train_split or self.create_validation_set else "test",
+            seed=self.seed,
+            create_validation_set=self.create_validation_set,
+        )
+
+        if needs_train_split:
             self.train_data = MVTecDataset(
                 root=self.root,
                 category=self.category,
@@ -412,7 +847,10 @@ class MVTec(LightningDataModule):
                 task=self.task,
                 seed=self.seed,
                 create_validation_set=self.create_validation_set,
+                samples=samples,
             )
+            if self.cache_in_memory:
+                self.train_data.cache_images()
 
         if self.create_validation_set:
             self.val_data = MVTecDataset(
@@ -423,6 +861,7 @@ class MVTec(LightningDataModule):
                 task=self.task,
                 seed=self.seed,
                 create_validation_set=self.create_validation_set,
+                samples=samples,
             )
 
         self.test_data = MVTecDataset(
@@ -433,25 +872,50 @@ class MVTec(LightningDataModule):
             task=self.task,
             seed=self.seed,
             create_validation_set=self.create_validation_set,
+            samples=samples,
         )
 
+        if self.cache_raw:
+            datasets = [self.test_data]
+            if needs_train_split:
+                datasets.append(self.train_data)
+            if self.create_validation_set:
+                datasets.append(self.val_data)
+            for dataset in datasets:
+                dataset.use_raw_image_cache(*_raw_image_cache_paths(self.dataset_path))
+
         if stage == "predict":
             self.inference_data = InferenceDataset(
                 path=self.root, image_size=self.image_size, transform_config=self.transform_config_val
             )
 
+    def _dataloader_kwargs(self) -> Dict[str, Any]:
+        """Get the keyword arguments shared by the train, validation and test dataloaders.
+
+        Workers are kept alive across epochs instead of being re-spawned and limited to a single thread each, and
+        batches are placed in page-locked memory so that host-to-device copies can overlap with compute.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments passed to ``DataLoader``.
+        """
+        kwargs: Dict[str, Any] = {"num_workers": self.num_workers, "pin_memory": True}
+        # Persistent workers and prefetching are only supported when loading with worker processes.
+        if self.num_workers > 0:
+            kwargs.update(persistent_workers=True, prefetch_factor=4, worker_init_fn=_worker_init_fn)
+        return kwargs
+
     def train_dataloader(self) -> TRAIN_DATALOADERS:
         """Get train dataloader."""
-        return DataLoader(self.train_data, shuffle=True, batch_size=self.train_batch_size, num_workers=self.num_workers)
+        return DataLoader(self.train_data, shuffle=True, batch_size=self.train_batch_size, **self._dataloader_kwargs())
 
     def val_dataloader(self) -> EVAL_DATALOADERS:
         """Get validation dataloader."""
         dataset = self.val_data if self.create_validation_set else self.test_data
-        return DataLoader(dataset=dataset, shuffle=False, batch_size=self.test_batch_size, num_workers=self.num_workers)
+        return DataLoader(dataset=dataset, shuffle=False, batch_size=self.test_batch_size, **self._dataloader_kwargs())
 
     def test_dataloader(self) -> EVAL_DATALOADERS:
         """Get test dataloader."""
-        return DataLoader(self.test_data, shuffle=False, batch_size=self.test_batch_size, num_workers=self.num_workers)
+        return DataLoader(self.test_data, shuffle=False, batch_size=self.test_batch_size, **self._dataloader_kwargs())
 
     def predict_dataloader(self) -> EVAL_DATALOADERS:
         """Get predict dataloader."""
@@ -3,7 +3,7 @@
 # Copyright (C) 2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
-from .download import DownloadProgressBar, hash_check
+from .download import DownloadProgressBar, download_file, hash_check
 from .generators import random_2d_perlin
 from .image import (
     generate_output_image_filename,
@@ -11,13 +11,16 @@ from .image import (
     get_image_height_and_width,
     read_image,
 )
+from .prefetch import DataPrefetcher
 
 __all__ = [
+    "download_file",
     "generate_output_image_filename",
     "get_image_filenames",
     "get_image_height_and_width",
     "hash_check",
     "random_2d_perlin",
     "read_image",
+    "DataPrefetcher",
     "DownloadProgressBar",
 ]
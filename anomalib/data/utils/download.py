@@ -1,12 +1,17 @@
-"""Helper to show progress bars with `urlretrieve`, check hash of file."""
+"""Helper to download files with progress bars, check hash of file."""
 
 # Copyright (C) 2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
 import hashlib
 import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Dict, Iterable, Optional, Union
+from urllib.error import URLError
+from urllib.request import Request, urlopen, urlretrieve
 
 from tqdm import tqdm
 
@@ -184,14 +189,103 @@ class DownloadProgressBar(tqdm):
         self.update(chunk_number * max_chunk_size - self.n)
 
 
-def hash_check(file_path: Path, expected_hash: str):
+class _RangeRequestIgnoredError(Exception):
+    """Raised when a server that advertises range requests responds to one with more than the requested range."""
+
+
+def download_file(
+    url: str,
+    file_path: Union[Path, str],
+    desc: Optional[str] = None,
+    num_connections: int = 8,
+    chunk_size: int = 1 << 20,
+) -> None:
+    """Download a file, fetching byte ranges over parallel connections when the server supports it.
+
+    A single HTTP stream is often throttled per connection, so the file is split into ``num_connections``
+    byte ranges that are downloaded concurrently and written at their offsets in the output file. Falls back to
+    a single ``urlretrieve`` stream if the server does not report the file size, does not accept range requests or
+    does not honour them.
+
+    Example:
+        >>> download_file(url, file_path=output_path, desc=url.split('/')[-1])
+
+    Args:
+        url (str): URL of the file to download.
+        file_path (Union[Path, str]): Path to which the file is written.
+        desc (Optional[str]): Prefix for the progress bar. Defaults to None.
+        num_connections (int): Number of parallel range requests. Defaults to 8.
+        chunk_size (int): Number of bytes read from a connection at a time. Defaults to 1 MiB.
+    """
+    try:
+        with urlopen(Request(url, method="HEAD")) as response:
+            size = int(response.headers.get("Content-Length", 0))
+            accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+    except URLError:
+        size, accepts_ranges = 0, False
+
+    with DownloadProgressBar(unit="B", unit_scale=True, miniters=1, desc=desc) as progress_bar:
+        if size == 0 or not accepts_ranges or num_connections <= 1:
+            urlretrieve(url=url, filename=file_path, reporthook=progress_bar.update_to)
+            return
+
+        progress_bar.total = size
+        lock = threading.Lock()
+
+        def download_range(start: int, end: int) -> None:
+            request = Request(url, headers={"Range": f"bytes={start}-{end}"})
+            with urlopen(request) as response, open(file_path, "r+b") as file:
+                if response.status != 206:
+                    raise _RangeRequestIgnoredError(f"Server did not honour the range request for {url}.")
+                file.seek(start)
+                chunk = response.read(chunk_size)
+                while chunk:
+                    file.write(chunk)
+                    with lock:
+                        progress_bar.update(len(chunk))
+                    chunk = response.read(chunk_size)
+
+        # Pre-allocate the file so that each range can be written at its own offset.
+        with open(file_path, "wb") as file:
+            file.truncate(size)
+
+        ranges = [(i * size // num_connections, (i + 1) * size // num_connections - 1) for i in range(num_connections)]
+        try:
+            with ThreadPoolExecutor(max_workers=num_connections) as executor:
+                futures = [executor.submit(download_range, start, end) for start, end in ranges if start <= end]
+                for future in futures:
+                    future.result()
+        except _RangeRequestIgnoredError:
+            # Overwrite the partially written file with a single stream.
+            progress_bar.reset()
+            urlretrieve(url=url, filename=file_path, reporthook=progress_bar.update_to)
+
+
+def hash_check(file_path: Path, expected_hash: str, algorithm: str = "md5", chunk_size: int = 8 << 20):
     """Raise assert error if hash does not match the calculated hash of the file.
 
+    The file is hashed in chunks so that large archives are not read into memory at once. Besides the algorithms
+    of ``hashlib``, ``blake3`` is supported when the ``blake3`` package is installed, in which case the file is
+    hashed with multiple threads.
+
     Args:
         file_path (Path): Path to file.
         expected_hash (str): Expected hash of the file.
+        algorithm (str): Name of the hash algorithm used to compute ``expected_hash``. Defaults to "md5".
+        chunk_size (int): Number of bytes read from the file at a time. Defaults to 8 MiB.
     """
+    if algorithm == "blake3":
+        if find_spec("blake3") is None:
+            raise ImportError("Checking a blake3 hash requires the blake3 package. Install it via `pip install blake3`")
+        import blake3  # pylint: disable=import-outside-toplevel
+
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    else:
+        hasher = hashlib.new(algorithm)
+
     with open(file_path, "rb") as hash_file:
-        assert (
-            hashlib.md5(hash_file.read()).hexdigest() == expected_hash
-        ), f"Downloaded file {file_path} does not match the required hash."
+        chunk = hash_file.read(chunk_size)
+        while chunk:
+            hasher.update(chunk)
+            chunk = hash_file.read(chunk_size)
+    assert hasher.hexdigest() == expected_hash, f"Downloaded file {file_path} does not match the required hash."
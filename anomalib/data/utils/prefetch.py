@@ -0,0 +1,83 @@
+"""Data prefetcher that overlaps host-to-device copies with compute."""
+
+# Copyright (C) 2022 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any, Iterator, Optional, Union
+
+import torch
+from pytorch_lightning.utilities.apply_func import (
+    apply_to_collection,
+    move_data_to_device,
+)
+from torch.utils.data import DataLoader
+
+
+class DataPrefetcher:
+    """Wrap a dataloader to copy the next batch to the device while the current batch is being processed.
+
+    When the device is a GPU, the copy of the next batch is issued on a dedicated CUDA stream one iteration
+    ahead, so that it overlaps with the computation on the current batch. This requires the dataloader to
+    use ``pin_memory=True`` for the copies to be asynchronous. On other devices, batches are moved to the
+    device synchronously.
+
+    Lightning already moves batches to the device, so the prefetcher is intended for loops that iterate over
+    the dataloaders of a datamodule directly.
+
+    Example:
+        >>> datamodule.setup()
+        >>> for batch in DataPrefetcher(datamodule.train_dataloader(), device="cuda"):
+        ...     output = model(batch["image"])
+
+    Args:
+        dataloader (DataLoader): Dataloader whose batches are prefetched.
+        device (Optional[Union[str, torch.device]]): Device to which the batches are moved. Defaults to the
+            current CUDA device if available, and to the CPU otherwise.
+    """
+
+    def __init__(self, dataloader: DataLoader, device: Optional[Union[str, torch.device]] = None) -> None:
+        self.dataloader = dataloader
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = torch.device(device)
+
+    def __len__(self) -> int:
+        """Get the number of batches of the wrapped dataloader."""
+        return len(self.dataloader)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the batches of the dataloader, moved to the device."""
+        if self.device.type != "cuda":
+            for batch in self.dataloader:
+                yield move_data_to_device(batch, self.device)
+            return
+
+        stream = torch.cuda.Stream(device=self.device)
+        iterator = iter(self.dataloader)
+        next_batch = self._preload(iterator, stream)
+        while next_batch is not None:
+            current_stream = torch.cuda.current_stream(self.device)
+            current_stream.wait_stream(stream)
+            batch = next_batch
+            # The batch was allocated on the side stream, so mark it as used by the current stream to prevent
+            # the caching allocator from reusing its memory while it is still being processed.
+            apply_to_collection(batch, torch.Tensor, lambda tensor: tensor.record_stream(current_stream))
+            next_batch = self._preload(iterator, stream)
+            yield batch
+
+    def _preload(self, iterator: Iterator[Any], stream: torch.cuda.Stream) -> Optional[Any]:
+        """Fetch the next batch and start copying it to the device on ``stream``.
+
+        Args:
+            iterator (Iterator[Any]): Iterator over the dataloader.
+            stream (torch.cuda.Stream): Stream on which the copy is issued.
+
+        Returns:
+            Optional[Any]: The next batch on the device, or ``None`` when the dataloader is exhausted.
+        """
+        try:
+            batch = next(iterator)
+        except StopIteration:
+            return None
+        with torch.cuda.stream(stream):
+            return move_data_to_device(batch, self.device)
@@ -7,8 +7,10 @@ from .post_process import (
     add_anomalous_label,
     add_normal_label,
     anomaly_map_to_color_map,
+    anomaly_maps_to_color_maps,
     compute_mask,
     superimpose_anomaly_map,
+    superimpose_color_map,
 )
 from .visualizer import ImageResult, Visualizer
 
@@ -16,7 +18,9 @@ __all__ = [
     "add_anomalous_label",
     "add_normal_label",
     "anomaly_map_to_color_map",
+    "anomaly_maps_to_color_maps",
     "superimpose_anomaly_map",
+    "superimpose_color_map",
     "compute_mask",
     "ImageResult",
     "Visualizer",
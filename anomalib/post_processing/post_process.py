@@ -5,11 +5,14 @@
 
 
 import math
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import cv2
 import numpy as np
+import torch
 from skimage import morphology
+from torch import Tensor
 
 
 def add_label(
@@ -94,6 +97,67 @@ def anomaly_map_to_color_map(anomaly_map: np.ndarray, normalize: bool = True) ->
     return anomaly_map
 
 
+# RGB colors of the JET color map for every intensity, which matches ``cv2.applyColorMap`` with ``COLORMAP_JET``.
+_JET_LOOKUP_TABLE = torch.from_numpy(
+    cv2.cvtColor(
+        cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(256, 1), cv2.COLORMAP_JET), cv2.COLOR_BGR2RGB
+    ).reshape(256, 3)
+)
+
+
+@lru_cache(maxsize=None)
+def _jet_lookup_table(device: torch.device) -> Tensor:
+    """Get the JET lookup table on ``device``, copying it to the device only once.
+
+    Args:
+        device (torch.device): Device of the lookup table.
+
+    Returns:
+        Tensor: JET lookup table of shape ``(256, 3)`` and type ``uint8``.
+    """
+    return _JET_LOOKUP_TABLE.to(device)
+
+
+def anomaly_maps_to_color_maps(anomaly_maps: Tensor, normalize: bool = False) -> Tensor:
+    """Compute the anomaly color heatmaps of a batch of anomaly maps in a single vectorized pass.
+
+    This is the batched counterpart of ``anomaly_map_to_color_map``. The maps are quantized and colorized by a
+    lookup into the JET color map on the device of ``anomaly_maps``, so that the whole batch can be copied to the
+    host at once rather than colorizing each map on the CPU.
+
+    Args:
+        anomaly_maps (Tensor): Anomaly maps of shape ``(B, H, W)`` or ``(B, 1, H, W)``.
+        normalize (bool, optional): Bool to normalize each anomaly map to its min-max range prior to applying
+            the color map. Defaults to False.
+
+    Returns:
+        Tensor: RGB color heatmaps of shape ``(B, H, W, 3)`` and type ``uint8``.
+    """
+    if anomaly_maps.dim() == 4:
+        anomaly_maps = anomaly_maps.squeeze(1)
+    if normalize:
+        minimum = anomaly_maps.amin(dim=(1, 2), keepdim=True)
+        maximum = anomaly_maps.amax(dim=(1, 2), keepdim=True)
+        anomaly_maps = (anomaly_maps - minimum) / (maximum - minimum)
+    indices = (anomaly_maps * 255).clamp(0, 255).to(torch.uint8).long()
+    return _jet_lookup_table(anomaly_maps.device)[indices]
+
+
+def superimpose_color_map(color_map: np.ndarray, image: np.ndarray, alpha: float = 0.4, gamma: int = 0) -> np.ndarray:
+    """Superimpose an anomaly color heatmap on top of the input image.
+
+    Args:
+        color_map (np.ndarray): Anomaly color heatmap, as computed by ``anomaly_map_to_color_map``.
+        image (np.ndarray): Input image
+        alpha (float, optional): Weight to overlay the color heatmap on the input image. Defaults to 0.4.
+        gamma (int, optional): Value to add to the blended image. Defaults to 0.
+
+    Returns:
+        np.ndarray: Image with the color heatmap superimposed on top of it.
+    """
+    return cv2.addWeighted(color_map, alpha, image, (1 - alpha), gamma)
+
+
 def superimpose_anomaly_map(
     anomaly_map: np.ndarray, image: np.ndarray, alpha: float = 0.4, gamma: int = 0, normalize: bool = False
 ) -> np.ndarray:
@@ -117,8 +181,7 @@ def superimpose_anomaly_map(
     """
 
     anomaly_map = anomaly_map_to_color_map(anomaly_map.squeeze(), normalize=normalize)
-    superimposed_map = cv2.addWeighted(anomaly_map, alpha, image, (1 - alpha), gamma)
-    return superimposed_map
+    return superimpose_color_map(anomaly_map, image, alpha, gamma)
 
 
 def compute_mask(anomaly_map: np.ndarray, threshold: float, kernel_size: int = 4) -> np.ndarray:
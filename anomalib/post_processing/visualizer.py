@@ -17,7 +17,9 @@ from anomalib.data.utils import read_image
 from anomalib.post_processing.post_process import (
     add_anomalous_label,
     add_normal_label,
+    anomaly_maps_to_color_maps,
     superimpose_anomaly_map,
+    superimpose_color_map,
 )
 
 
@@ -31,13 +33,17 @@ class ImageResult:
     anomaly_map: Optional[np.ndarray] = None
     gt_mask: Optional[np.ndarray] = None
     pred_mask: Optional[np.ndarray] = None
+    anomaly_color_map: Optional[np.ndarray] = None
 
     heat_map: np.ndarray = field(init=False)
     segmentations: np.ndarray = field(init=False)
 
     def __post_init__(self) -> None:
         """Generate heatmap overlay and segmentations, convert masks to images."""
-        if self.anomaly_map is not None:
+        if self.anomaly_color_map is not None:
+            # The color heatmap was computed beforehand, e.g. for the whole batch with ``anomaly_maps_to_color_maps``.
+            self.heat_map = superimpose_color_map(self.anomaly_color_map, self.image)
+        elif self.anomaly_map is not None:
             self.heat_map = superimpose_anomaly_map(self.anomaly_map, self.image, normalize=False)
         if self.pred_mask is not None and self.pred_mask.max() <= 1.0:
             self.pred_mask *= 255
@@ -74,14 +80,19 @@ class Visualizer:
             Generator that yields a display-ready visualization for each image.
         """
         batch_size, _num_channels, height, width = batch["image"].size()
+        # Colorize the anomaly maps of the whole batch on their device and copy only the color maps to the host, in a
+        # single transfer.
+        color_maps: Optional[np.ndarray] = None
+        if "anomaly_maps" in batch:
+            color_maps = anomaly_maps_to_color_maps(batch["anomaly_maps"]).cpu().numpy()
         for i in range(batch_size):
             image_result = ImageResult(
                 image=read_image(path=batch["image_path"][i], image_size=(height, width)),
                 pred_score=batch["pred_scores"][i].cpu().numpy().item(),
                 pred_label=batch["pred_labels"][i].cpu().numpy().item(),
-                anomaly_map=batch["anomaly_maps"][i].cpu().numpy() if "anomaly_maps" in batch else None,
                 pred_mask=batch["pred_masks"][i].squeeze().int().cpu().numpy() if "pred_masks" in batch else None,
                 gt_mask=batch["mask"][i].squeeze().int().cpu().numpy() if "mask" in batch else None,
+                anomaly_color_map=color_maps[i] if color_maps is not None else None,
             )
             yield self.visualize_image(image_result)
 
@@ -3,10 +3,14 @@
 # Copyright (C) 2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
 
+import numpy as np
 import pytorch_lightning as pl
+import torch
 from pytorch_lightning.utilities.cli import CALLBACK_REGISTRY
 from pytorch_lightning.utilities.types import STEP_OUTPUT
 
@@ -26,6 +30,91 @@ class ImageVisualizerCallback(BaseVisualizerCallback):
     config.yaml file.
     """
 
+    # Keys of the step outputs whose values are read by the visualizer on a per-image basis. The anomaly maps are
+    # left on their device, since the visualizer colorizes them there and only copies the color maps to the host.
+    _visualized_keys = ("pred_scores", "pred_labels", "pred_masks", "mask")
+    _io_pool: Optional[ThreadPoolExecutor] = None
+    _pending_saves: List[Future]
+
+    def _outputs_to_cpu(self, outputs: STEP_OUTPUT) -> STEP_OUTPUT:
+        """Copy the visualized tensors of the step outputs to the host in a single transfer per tensor.
+
+        The visualizer indexes the outputs per image and moves each slice to the host, which results in several
+        blocking device-to-host copies per image. Instead, each tensor is copied to the host once for the whole batch.
+        This only has an effect on prediction, since ``AnomalyModule.test_step_end`` already moves the test outputs to
+        the host.
+
+        Args:
+            outputs (STEP_OUTPUT): Outputs of the current step.
+
+        Returns:
+            STEP_OUTPUT: Shallow copy of the outputs in which the visualized tensors reside on the host.
+        """
+        if not isinstance(outputs, dict):
+            return outputs
+
+        host_outputs = dict(outputs)
+        for key in self._visualized_keys:
+            if isinstance(outputs.get(key), torch.Tensor):
+                host_outputs[key] = outputs[key].cpu()
+        return host_outputs
+
+    def _save_in_background(self, file_path: Path, image: np.ndarray) -> None:
+        """Save an image to the file system in a background thread.
+
+        PNG encoding and disk writes release the GIL, so the images of a batch are written concurrently while the
+        next batch is processed. Call ``_wait_for_saves`` to block until all submitted images are written.
+
+        Args:
+            file_path (Path): Path to which the image will be saved.
+            image (np.ndarray): Image that will be saved to the file system.
+        """
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+            self._pending_saves = []
+        self._pending_saves.append(self._io_pool.submit(self.visualizer.save, file_path, image))
+
+    def _wait_for_saves(self) -> None:
+        """Block until the submitted images are written and release the background threads."""
+        if self._io_pool is None:
+            return
+        self._io_pool.shutdown(wait=True)
+        self._io_pool = None
+        # Re-raise any exception that occurred while saving an image.
+        for future in self._pending_saves:
+            future.result()
+        self._pending_saves = []
+
+    def _process_batch(
+        self,
+        outputs: STEP_OUTPUT,
+        pl_module: Optional[AnomalyModule] = None,
+        trainer: Optional[pl.Trainer] = None,
+    ) -> None:
+        """Visualize the images of a batch once and dispatch them to be saved, logged and shown.
+
+        Args:
+            outputs (STEP_OUTPUT): Outputs of the current step.
+            pl_module (Optional[AnomalyModule]): Anomaly module. The images are only logged when both ``pl_module``
+                and ``trainer`` are provided.
+            trainer (Optional[pl.Trainer]): Pytorch lightning trainer which holds reference to the loggers.
+        """
+        log_images = self.log_images and pl_module is not None and trainer is not None
+        # Composing the visualizations is the most expensive step, so skip it when the images are not used.
+        if not (self.save_images or log_images or self.show_images):
+            return
+
+        outputs = self._outputs_to_cpu(outputs)
+        for i, image in enumerate(self.visualizer.visualize_batch(outputs)):
+            filename = Path(outputs["image_path"][i])
+            if self.save_images:
+                file_path = self.image_save_path / filename.parent.name / filename.name
+                self._save_in_background(file_path, image)
+            if log_images and pl_module is not None and trainer is not None:
+                self._add_to_logger(image, pl_module, trainer, filename)
+            if self.show_images:
+                self.visualizer.show(str(filename), image)
+
     def on_predict_batch_end(
         self,
         _trainer: pl.Trainer,
@@ -47,13 +136,7 @@ class ImageVisualizerCallback(BaseVisualizerCallback):
             _dataloader_idx (int): Index of the dataloader that yielded the current batch (unused).
         """
         assert outputs is not None
-        for i, image in enumerate(self.visualizer.visualize_batch(outputs)):
-            filename = Path(outputs["image_path"][i])
-            if self.save_images:
-                file_path = self.image_save_path / filename.parent.name / filename.name
-                self.visualizer.save(file_path, image)
-            if self.show_images:
-                self.visualizer.show(str(filename), image)
+        self._process_batch(outputs)
 
     def on_test_batch_end(
         self,
@@ -76,12 +159,23 @@ class ImageVisualizerCallback(BaseVisualizerCallback):
             _dataloader_idx (int): Index of the dataloader that yielded the current batch (unused).
         """
         assert outputs is not None
-        for i, image in enumerate(self.visualizer.visualize_batch(outputs)):
-            filename = Path(outputs["image_path"][i])
-            if self.save_images:
-                file_path = self.image_save_path / filename.parent.name / filename.name
-                self.visualizer.save(file_path, image)
-            if self.log_images:
-                self._add_to_logger(image, pl_module, trainer, filename)
-            if self.show_images:
-                self.visualizer.show(str(filename), image)
+        self._process_batch(outputs, pl_module, trainer)
+
+    def on_predict_epoch_end(self, _trainer: pl.Trainer, _pl_module: AnomalyModule, _outputs: List[Any]) -> None:
+        """Wait for the images of the prediction epoch to be saved.
+
+        Args:
+            _trainer (Trainer): Pytorch lightning trainer object (unused).
+            _pl_module (LightningModule): Lightning module (unused).
+            _outputs (List[Any]): Outputs of the prediction epoch (unused).
+        """
+        self._wait_for_saves()
+
+    def on_test_epoch_end(self, _trainer: pl.Trainer, _pl_module: AnomalyModule) -> None:
+        """Wait for the images of the test epoch to be saved.
+
+        Args:
+            _trainer (Trainer): Pytorch lightning trainer object (unused).
+            _pl_module (LightningModule): Lightning module (unused).
+        """
+        self._wait_for_saves()
@@ -0,0 +1,113 @@
+"""Download and Hash Check Tests."""
+
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from anomalib.data.utils import download_file, hash_check
+
+PAYLOAD = os.urandom(100_003)
+
+
+def get_handler(accept_ranges: bool, honour_ranges: bool):
+    """Get a request handler that serves ``PAYLOAD`` with the given support for range requests."""
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serve ``PAYLOAD``, answering range requests with partial content if ``honour_ranges`` is set."""
+
+        def send_payload_headers(self, status: int, length: int) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", str(length))
+            if accept_ranges:
+                self.send_header("Accept-Ranges", "bytes")
+
+        def do_HEAD(self):  # pylint: disable=invalid-name
+            self.send_payload_headers(200, len(PAYLOAD))
+            self.end_headers()
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            byte_range = self.headers.get("Range")
+            if byte_range is None or not honour_ranges:
+                self.send_payload_headers(200, len(PAYLOAD))
+                self.end_headers()
+                self.wfile.write(PAYLOAD)
+                return
+
+            start, end = (int(position) for position in byte_range[len("bytes=") :].split("-"))
+            self.send_payload_headers(206, end - start + 1)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+            self.end_headers()
+            self.wfile.write(PAYLOAD[start : end + 1])
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def serve() -> Iterator:
+    """Serve ``PAYLOAD`` from a local HTTP server and yield a function that starts it and returns its URL."""
+    servers = []
+
+    def start(accept_ranges: bool, honour_ranges: bool) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), get_handler(accept_ranges, honour_ranges))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}/archive.tar.xz"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class TestDownloadFile:
+    """Test downloading files with parallel range requests."""
+
+    @pytest.mark.parametrize(
+        ("accept_ranges", "honour_ranges"),
+        [(True, True), (False, False), (True, False)],
+        ids=["ranges", "no_ranges", "ignored_ranges"],
+    )
+    @pytest.mark.parametrize("num_connections", [1, 8])
+    def test_downloads_whole_file(self, serve, tmp_path, accept_ranges, honour_ranges, num_connections):
+        """The downloaded file should match the served file whether or not range requests are honoured."""
+        file_path = tmp_path / "archive.tar.xz"
+        download_file(serve(accept_ranges, honour_ranges), file_path=file_path, num_connections=num_connections)
+        assert file_path.read_bytes() == PAYLOAD
+
+
+class TestHashCheck:
+    """Test checking the hash of a file in chunks."""
+
+    @staticmethod
+    def write_payload(tmp_path: Path) -> Path:
+        file_path = tmp_path / "archive.tar.xz"
+        file_path.write_bytes(PAYLOAD)
+        return file_path
+
+    @pytest.mark.parametrize("chunk_size", [1 << 10, len(PAYLOAD), 8 << 20])
+    @pytest.mark.parametrize("algorithm", ["md5", "sha256"])
+    def test_matching_hash(self, tmp_path, algorithm, chunk_size):
+        """A file should pass the check regardless of the chunk size it is hashed in."""
+        expected_hash = hashlib.new(algorithm, PAYLOAD).hexdigest()
+        hash_check(self.write_payload(tmp_path), expected_hash, algorithm=algorithm, chunk_size=chunk_size)
+
+    def test_mismatching_hash(self, tmp_path):
+        """A file whose hash differs from the expected hash should fail the check."""
+        with pytest.raises(AssertionError):
+            hash_check(self.write_payload(tmp_path), hashlib.md5(b"other").hexdigest(), chunk_size=1 << 10)
+
+    def test_blake3(self, tmp_path):
+        """The blake3 hash of a file should be computed in chunks with the blake3 package."""
+        blake3 = pytest.importorskip("blake3")
+        file_path = self.write_payload(tmp_path)
+        hash_check(file_path, blake3.blake3(PAYLOAD).hexdigest(), algorithm="blake3", chunk_size=1 << 10)
+        with pytest.raises(AssertionError):
+            hash_check(file_path, blake3.blake3(b"other").hexdigest(), algorithm="blake3")
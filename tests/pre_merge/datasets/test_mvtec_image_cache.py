@@ -0,0 +1,138 @@
+"""MVTec AD Image Cache Tests."""
+
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+import pytest
+
+from anomalib.data.mvtec import (
+    MVTecDataset,
+    _png_image_shape,
+    _raw_image_cache_paths,
+    _write_raw_image_cache,
+)
+from anomalib.data.utils import read_image
+from anomalib.pre_processing import PreProcessor
+
+
+def make_image_tree(root: Path, shapes: Optional[Dict[str, Tuple[int, ...]]] = None) -> Path:
+    """Create an MVTec AD category of random png images.
+
+    The default images of the category are overridden and complemented by ``shapes``, which maps the path of an
+    image, relative to the category, to its shape.
+    """
+    shapes = {
+        **{f"train/good/{index:03d}.png": (6, 8, 3) for index in range(4)},
+        "test/good/000.png": (6, 8, 3),
+        "test/broken/000.png": (6, 8),
+        "ground_truth/broken/000_mask.png": (6, 8),
+        **(shapes or {}),
+    }
+    path = root / "bottle"
+    rng = np.random.default_rng(0)
+    for image_path, shape in shapes.items():
+        (path / image_path).parent.mkdir(parents=True, exist_ok=True)
+        cv2.imwrite(str(path / image_path), rng.integers(0, 256, shape, dtype=np.uint8))
+    return path
+
+
+def get_dataset(path: Path, split: str = "train") -> MVTecDataset:
+    return MVTecDataset(
+        root=path.parent, category=path.name, pre_process=PreProcessor(image_size=8), split=split, seed=0
+    )
+
+
+def assert_images_match_decoded_images(dataset: MVTecDataset) -> None:
+    for index, image_path in enumerate(dataset.samples.image_path):
+        np.testing.assert_array_equal(dataset._read_image(index, image_path), read_image(image_path))
+
+
+class TestInMemoryImageCache:
+    """Test caching the decoded images of a dataset in shared memory."""
+
+    def test_png_image_shape(self, tmp_path):
+        """The decoded shape of a png image should be read from its header, grayscale images being decoded as RGB."""
+        cv2.imwrite(str(tmp_path / "rgb.png"), np.zeros((5, 7, 3), dtype=np.uint8))
+        cv2.imwrite(str(tmp_path / "gray.png"), np.zeros((6, 4), dtype=np.uint8))
+        assert _png_image_shape(str(tmp_path / "rgb.png")) == (5, 7, 3)
+        assert _png_image_shape(str(tmp_path / "gray.png")) == (6, 4, 3)
+
+    def test_png_image_shape_of_other_files(self, tmp_path):
+        """Files that are not png images should not report a shape."""
+        cv2.imwrite(str(tmp_path / "image.jpg"), np.zeros((5, 7, 3), dtype=np.uint8))
+        (tmp_path / "empty.png").touch()
+        assert _png_image_shape(str(tmp_path / "image.jpg")) is None
+        assert _png_image_shape(str(tmp_path / "empty.png")) is None
+
+    @pytest.mark.parametrize("split", ["train", "test"])
+    def test_cached_images_match_decoded_images(self, tmp_path, split):
+        """Images read from the cache should be identical to the images decoded from disk, and read-only."""
+        dataset = get_dataset(make_image_tree(tmp_path), split)
+        dataset.cache_images()
+        assert dataset.image_cache is not None
+        assert_images_match_decoded_images(dataset)
+        for index, image_path in enumerate(dataset.samples.image_path):
+            assert not dataset._read_image(index, image_path).flags.writeable
+
+    def test_mixed_sizes_skip_cache(self, tmp_path, caplog):
+        """Images of different sizes should not be cached, and should still be decoded from disk."""
+        dataset = get_dataset(make_image_tree(tmp_path, {"train/good/004.png": (8, 6, 3)}))
+        with caplog.at_level(logging.WARNING):
+            dataset.cache_images()
+        assert dataset.image_cache is None
+        assert "differ in size" in caplog.text
+        assert_images_match_decoded_images(dataset)
+
+
+class TestRawImageCache:
+    """Test reading the images of a dataset from a memory-mapped raw image cache."""
+
+    @pytest.mark.parametrize("split", ["train", "test"])
+    def test_cached_images_match_decoded_images(self, tmp_path, split):
+        """Images of different sizes and channels read from the cache should be identical to the decoded images."""
+        path = make_image_tree(tmp_path, {"train/good/004.png": (8, 6, 3), "test/broken/001.png": (5, 9)})
+        _write_raw_image_cache(path)
+        dataset = get_dataset(path, split)
+        dataset.use_raw_image_cache(*_raw_image_cache_paths(path))
+        assert dataset.raw_cache_path is not None
+        assert_images_match_decoded_images(dataset)
+        for index, image_path in enumerate(dataset.samples.image_path):
+            assert not dataset._read_image(index, image_path).flags.writeable
+
+    def test_missing_cache_falls_back_to_decoding(self, tmp_path, caplog):
+        """The images should be decoded from disk when the cache has not been written."""
+        path = make_image_tree(tmp_path)
+        dataset = get_dataset(path)
+        with caplog.at_level(logging.WARNING):
+            dataset.use_raw_image_cache(*_raw_image_cache_paths(path))
+        assert dataset.raw_cache_path is None
+        assert "does not exist" in caplog.text
+        assert_images_match_decoded_images(dataset)
+
+    def test_out_of_date_cache_falls_back_to_decoding(self, tmp_path, caplog):
+        """The images should be decoded from disk when the cache does not contain all the images of the dataset."""
+        path = make_image_tree(tmp_path)
+        _write_raw_image_cache(path)
+        make_image_tree(tmp_path, {"train/good/004.png": (6, 8, 3)})
+        dataset = get_dataset(path)
+        with caplog.at_level(logging.WARNING):
+            dataset.use_raw_image_cache(*_raw_image_cache_paths(path))
+        assert dataset.raw_cache_path is None
+        assert "out of date" in caplog.text
+        assert_images_match_decoded_images(dataset)
+
+    def test_pickled_state_drops_memory_map(self, tmp_path):
+        """The memory map should not be pickled, so that each dataloader worker maps the cache itself."""
+        path = make_image_tree(tmp_path)
+        _write_raw_image_cache(path)
+        dataset = get_dataset(path)
+        dataset.use_raw_image_cache(*_raw_image_cache_paths(path))
+        dataset._read_image(0, dataset.samples.image_path[0])
+        assert dataset._raw_images is not None
+        state = dataset.__getstate__()
+        assert state["_raw_images"] is None
+        assert state["raw_cache_path"] == dataset.raw_cache_path
+        assert dataset._raw_images is not None
@@ -0,0 +1,148 @@
+"""MVTec AD Sample Parsing Tests."""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from anomalib.data import mvtec
+from anomalib.data.mvtec import (
+    SAMPLE_CACHE_DISABLE_ENV,
+    _iter_png_files,
+    _load_mvtec_samples,
+    make_mvtec_dataset,
+)
+
+
+def make_mvtec_tree(root: Path, normal_test_images: bool = True) -> Path:
+    """Create an MVTec AD category of empty png files, which is all that is needed to parse the samples."""
+    path = root / "bottle"
+    images = {
+        "train/good": [f"{index:03d}.png" for index in range(12)],
+        "test/broken_large": ["000.png", "001.png", "gpng.png"],
+        "test/contamination": ["000.png", "png.png"],
+        "ground_truth/broken_large": ["000_mask.png", "001_mask.png", "gpng_mask.png"],
+        "ground_truth/contamination": ["000_mask.png", "png_mask.png"],
+    }
+    if normal_test_images:
+        images["test/good"] = ["000.png", "001.png", "002.png"]
+    for directory, filenames in images.items():
+        (path / directory).mkdir(parents=True)
+        for filename in filenames:
+            (path / directory / filename).touch()
+    return path
+
+
+class TestMakeMVTecDataset:
+    """Test parsing the samples of an MVTec AD category."""
+
+    def test_mask_path_of_stem_ending_with_png(self, tmp_path):
+        """Only the ``.png`` extension should be stripped from an image filename to get its mask path."""
+        path = make_mvtec_tree(tmp_path)
+        samples = make_mvtec_dataset(path, split="test").set_index("image_path")
+        assert (
+            samples.mask_path[f"{path}/test/broken_large/gpng.png"] == f"{path}/ground_truth/broken_large/gpng_mask.png"
+        )
+        assert (
+            samples.mask_path[f"{path}/test/contamination/png.png"] == f"{path}/ground_truth/contamination/png_mask.png"
+        )
+        assert samples.mask_path[f"{path}/test/good/000.png"] == ""
+
+    @pytest.mark.parametrize("normal_test_images", [True, False], ids=["normal_test_images", "no_normal_test_images"])
+    @pytest.mark.parametrize(
+        ("split", "create_validation_set"), [("train", False), ("test", False), ("val", True), ("test", True)]
+    )
+    def test_split_matches_all_samples(self, tmp_path, normal_test_images, split, create_validation_set):
+        """Parsing a single split should give the samples of that split when parsing the whole category."""
+        path = make_mvtec_tree(tmp_path, normal_test_images)
+        samples = make_mvtec_dataset(path, split=split, seed=0, create_validation_set=create_validation_set)
+        all_samples = make_mvtec_dataset(path, split=None, seed=0, create_validation_set=create_validation_set)
+        expected_samples = all_samples[all_samples.split == split].reset_index(drop=True)
+        # The label categories only contain the labels found in the traversed directories.
+        pd.testing.assert_frame_equal(samples, expected_samples, check_categorical=False)
+
+    def test_traversal_order_matches_glob(self, tmp_path):
+        """The png files should be visited in the same order as ``Path.glob``, on which the seeded splits depend."""
+        path = make_mvtec_tree(tmp_path)
+        (path / "train" / "good" / "nested" / "deeper").mkdir(parents=True)
+        for directory in [path / "train" / "good" / "nested", path / "train" / "good" / "nested" / "deeper"]:
+            for index in range(3):
+                (directory / f"{index:03d}.png").touch()
+        assert list(_iter_png_files(path)) == [str(file_path) for file_path in path.glob("**/*.png")]
+
+
+class TestSampleCache:
+    """Test caching the parsed samples of an MVTec AD category."""
+
+    @pytest.fixture(autouse=True)
+    def require_pyarrow(self, monkeypatch):
+        pytest.importorskip("pyarrow")
+        monkeypatch.delenv(SAMPLE_CACHE_DISABLE_ENV, raising=False)
+
+    @staticmethod
+    def get_cache_files(path: Path):
+        return list(path.glob(".samples_*.feather"))
+
+    def test_cached_samples_match_parsed_samples(self, tmp_path):
+        """Samples read back from the cache should be identical to the ones parsed from the file system."""
+        path = make_mvtec_tree(tmp_path)
+        samples = _load_mvtec_samples(path, seed=0, create_validation_set=True)
+        assert len(self.get_cache_files(path)) == 1
+        pd.testing.assert_frame_equal(_load_mvtec_samples(path, seed=0, create_validation_set=True), samples)
+        pd.testing.assert_frame_equal(samples, make_mvtec_dataset(path, seed=0, create_validation_set=True))
+
+    def test_split_of_cached_samples(self, tmp_path):
+        """A split read from the cache should match the split parsed from the file system."""
+        path = make_mvtec_tree(tmp_path, normal_test_images=False)
+        _load_mvtec_samples(path, seed=0)
+        pd.testing.assert_frame_equal(
+            _load_mvtec_samples(path, split="test", seed=0), make_mvtec_dataset(path, "test", seed=0)
+        )
+
+    def test_moved_dataset_rebuilds_cache(self, tmp_path):
+        """The cache should be rebuilt when the dataset is read from another path than the one it was written for."""
+        path = make_mvtec_tree(tmp_path / "old")
+        _load_mvtec_samples(path, seed=0)
+        new_path = tmp_path / "new" / "bottle"
+        new_path.parent.mkdir()
+        shutil.move(str(path), str(new_path))
+        samples = _load_mvtec_samples(new_path, seed=0)
+        assert (samples.path == str(new_path)).all()
+        assert samples.image_path.str.startswith(str(new_path)).all()
+
+    def test_unchanged_dataset_reads_cache(self, tmp_path, monkeypatch):
+        """The samples should be read from the cache rather than parsed again when the dataset is unchanged."""
+        path = make_mvtec_tree(tmp_path)
+        samples = _load_mvtec_samples(path, seed=0)
+        monkeypatch.setattr(mvtec, "make_mvtec_dataset", pytest.fail)
+        pd.testing.assert_frame_equal(_load_mvtec_samples(path, seed=0), samples)
+
+    def test_changed_dataset_rebuilds_cache(self, tmp_path):
+        """The cache should be rebuilt when images are added to or removed from the dataset."""
+        path = make_mvtec_tree(tmp_path)
+        _load_mvtec_samples(path, seed=0)
+        (path / "train" / "good" / "000.png").unlink()
+        (path / "test" / "good" / "999.png").touch()
+        samples = _load_mvtec_samples(path, seed=0)
+        assert f"{path}/train/good/000.png" not in set(samples.image_path)
+        assert f"{path}/test/good/999.png" in set(samples.image_path)
+        pd.testing.assert_frame_equal(samples, make_mvtec_dataset(path, seed=0))
+
+    def test_unreadable_cache_is_rebuilt(self, tmp_path):
+        """A corrupt cache should be rebuilt instead of failing to load the samples."""
+        path = make_mvtec_tree(tmp_path)
+        samples = _load_mvtec_samples(path, seed=0)
+        (cache_file,) = self.get_cache_files(path)
+        cache_file.write_bytes(b"corrupt")
+        pd.testing.assert_frame_equal(_load_mvtec_samples(path, seed=0), samples)
+        pd.testing.assert_frame_equal(_load_mvtec_samples(path, seed=0), samples)
+
+    def test_cache_disabled(self, tmp_path, monkeypatch):
+        """No cache should be written without a seed or when it is disabled with the environment variable."""
+        path = make_mvtec_tree(tmp_path)
+        _load_mvtec_samples(path, seed=None)
+        assert len(self.get_cache_files(path)) == 0
+        monkeypatch.setenv(SAMPLE_CACHE_DISABLE_ENV, "1")
+        _load_mvtec_samples(path, seed=0)
+        assert len(self.get_cache_files(path)) == 0
@@ -0,0 +1,33 @@
+"""Data Prefetcher Tests."""
+
+import torch
+from torch.utils.data import DataLoader
+
+from anomalib.data.utils import DataPrefetcher
+
+
+class TestDataPrefetcher:
+    """Test Data Prefetcher."""
+
+    @staticmethod
+    def get_dataloader() -> DataLoader:
+        dataset = [{"image": torch.full((3, 8, 8), i, dtype=torch.float32), "label": i} for i in range(10)]
+        return DataLoader(dataset, batch_size=4, shuffle=False)
+
+    def test_yields_all_batches(self):
+        """Prefetcher should yield every batch of the wrapped dataloader in order."""
+        dataloader = self.get_dataloader()
+        prefetcher = DataPrefetcher(dataloader, device="cpu")
+
+        batches = list(prefetcher)
+        assert len(prefetcher) == len(dataloader) == len(batches)
+        for batch, expected in zip(batches, dataloader):
+            assert torch.equal(batch["image"], expected["image"])
+            assert torch.equal(batch["label"], expected["label"])
+
+    def test_moves_batches_to_device(self):
+        """Prefetcher should move the tensors of each batch to the requested device."""
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        for batch in DataPrefetcher(self.get_dataloader(), device=device):
+            assert batch["image"].device.type == device.type
+            assert batch["label"].device.type == device.type
@@ -0,0 +1,26 @@
+"""Tests for the post-processing utils."""
+
+# Copyright (C) 2022 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+import torch
+
+from anomalib.post_processing import (
+    anomaly_map_to_color_map,
+    anomaly_maps_to_color_maps,
+)
+
+
+@pytest.mark.parametrize("normalize", [False, True])
+def test_batched_color_maps_match_per_image_color_maps(normalize):
+    """Test if colorizing a batch of anomaly maps gives the same result as colorizing each map separately."""
+    anomaly_maps = torch.rand(4, 1, 32, 32, dtype=torch.float64)
+    color_maps = anomaly_maps_to_color_maps(anomaly_maps, normalize=normalize)
+
+    assert color_maps.shape == (4, 32, 32, 3)
+    assert color_maps.dtype == torch.uint8
+    for anomaly_map, color_map in zip(anomaly_maps, color_maps):
+        expected = anomaly_map_to_color_map(anomaly_map.squeeze().numpy(), normalize=normalize)
+        assert np.array_equal(color_map.numpy(), expected)